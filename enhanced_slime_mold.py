@@ -1,75 +1,340 @@
 import pygame
 import numpy as np
-import random
-from noise import snoise2
 import math
+import os
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from dataclasses import dataclass
-from typing import List, Dict
+
+try:
+    # Numba is optional; without it SlimeMold falls back to the NumPy update
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 class Species(Enum):
-    PHYSARUM = 1
-    DICTYOSTELIUM = 2
-    FULIGO = 3
-
-@dataclass
-class Particle:
-    x: float
-    y: float
-    angle: float
-    speed: float
-    species: Species
-    energy: float
-    moisture_preference: float
-    temperature_preference: float
-    trail_strength: float
-    sensor_distance: float
-    sensor_angle: float
-    rotation_angle: float
+    # Values double as indices into the per-species parameter tables
+    PHYSARUM = 0
+    DICTYOSTELIUM = 1
+    FULIGO = 2
+
+class ParticleArrays:
+    """Structure-of-arrays particle storage.
+
+    Every field is a pre-allocated column; only the first ``count`` entries
+    are live. Columns double in size whenever they run out of room.
+    """
+    FLOAT_FIELDS = ('x', 'y', 'angle', 'speed', 'energy', 'sensor_distance',
+                    'rotation_angle')
+    FIELDS = FLOAT_FIELDS + ('species_id',)
+
+    def __init__(self, capacity: int = 1024):
+        self.capacity = capacity
+        self.count = 0
+        for name in self.FLOAT_FIELDS:
+            setattr(self, name, np.empty(capacity, dtype=np.float32))
+        self.species_id = np.empty(capacity, dtype=np.int8)
+
+    def __len__(self):
+        return self.count
+
+    def _grow(self, needed: int):
+        capacity = self.capacity
+        while capacity < needed:
+            capacity *= 2
+        for name in self.FIELDS:
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+        self.capacity = capacity
+
+    def append(self, n: int, **values) -> slice:
+        # Values may be scalars or length-n arrays; every field must be given
+        start, end = self.count, self.count + n
+        if end > self.capacity:
+            self._grow(end)
+        for name in self.FIELDS:
+            getattr(self, name)[start:end] = values[name]
+        self.count = end
+        return slice(start, end)
+
+    def keep(self, mask: np.ndarray):
+        # Drop every live particle whose entry in mask is False, compacting
+        # the survivors to the front of each column in place
+        n = int(np.count_nonzero(mask))
+        if n == self.count:
+            return
+        for name in self.FIELDS:
+            column = getattr(self, name)
+            column[:n] = column[:self.count][mask]
+        self.count = n
+
+    def clear(self):
+        self.count = 0
+
+if NUMBA_AVAILABLE:
+    @njit(fastmath=True, boundscheck=False, cache=True)
+    def _sensor_value(x, y, energy, food_map, pheromone_map, obstacle_map, width, height):
+        x = int(x) % width
+        y = int(y) % height
+        if obstacle_map[x, y] > np.float32(0.5):
+            return np.float32(-1.0)
+        food_value = food_map[x, y]
+        if food_value > np.float32(0.0):
+            hunger_factor = np.float32(1.0) + (np.float32(100.0) - energy) / np.float32(20.0)
+            return food_value * np.float32(100.0) * hunger_factor
+        return pheromone_map[x, y] * np.float32(0.5)
+
+    @njit(parallel=True, fastmath=True, boundscheck=False, cache=True)
+    def _update_particles(x, y, angle, speed, energy, species_id, sensor_distance,
+                          rotation_angle, moisture_pref, temp_pref, sensor_cos,
+                          sensor_sin, turn_scale, random_turn_chance,
+                          temperature_map, moisture_map,
+                          temperature_offset, moisture_offset, food_map, obstacle_map,
+                          pheromone_map, width, height, reproduction_chance,
+                          ix, iy, ate, births):
+        """JIT-compiled equivalent of the NumPy particle step in SlimeMold.
+
+        Each particle runs all ix.shape[0] steps back to back against the maps
+        as they were at the start of the call, so its state stays in registers.
+        The one exception is food: a particle keeps a private budget for the
+        cell it is on, so staying put cannot feed it more often than the step
+        by step path would.
+        Particles only write their own columns; the cell visited at every step
+        and whether the particle fed there are returned through ix/iy/ate
+        (ix is -1 for steps after the particle died) and offspring are counted
+        in births, so that shared map writes happen after the loop.
+        """
+        num_steps = ix.shape[0]
+        # Every constant below is float32 so the per-particle maths stays in
+        # single precision instead of widening to float64 against the literals
+        fwidth = np.float32(width)
+        fheight = np.float32(height)
+        # prange hands each thread a contiguous block of particles, so every
+        # column is already walked stride-1 per thread. Blocking the loop into
+        # 16-particle AoSoA tiles measured no different: the body is bound by
+        # map gathers and branches and does not SIMD-vectorize either way
+        for i in prange(x.shape[0]):
+            sid = species_id[i]
+            food_cx = -1
+            food_cy = -1
+            food_left = np.float32(0.0)
+            for step in range(num_steps):
+                cx = int(x[i]) % width
+                cy = int(y[i]) % height
+                
+                # Environmental stress slows particles down
+                temperature = temperature_map[cx, cy] + temperature_offset
+                moisture = moisture_map[cx, cy] + moisture_offset
+                stress = abs(temperature - temp_pref[sid]) / np.float32(10.0) + abs(moisture - moisture_pref[sid])
+                speed[i] = max(np.float32(0.1), speed[i] * (np.float32(1.0) - stress * np.float32(0.1)))
+                
+                # Sense ahead, left and right; the side sensors are derived from the
+                # heading with the angle-addition identities instead of more trig calls
+                sensor_dist = sensor_distance[i] * (np.float32(1.0) + (np.float32(100.0) - energy[i]) / np.float32(50.0))
+                a = angle[i]
+                ca = math.cos(a)
+                sa = math.sin(a)
+                cs = sensor_cos[sid]
+                ss = sensor_sin[sid]
+                front_val = _sensor_value(x[i] + sensor_dist * ca,
+                                          y[i] + sensor_dist * sa,
+                                          energy[i], food_map, pheromone_map, obstacle_map, width, height)
+                left_val = _sensor_value(x[i] + sensor_dist * (ca * cs + sa * ss),
+                                         y[i] + sensor_dist * (sa * cs - ca * ss),
+                                         energy[i], food_map, pheromone_map, obstacle_map, width, height)
+                right_val = _sensor_value(x[i] + sensor_dist * (ca * cs - sa * ss),
+                                          y[i] + sensor_dist * (sa * cs + ca * ss),
+                                          energy[i], food_map, pheromone_map, obstacle_map, width, height)
+                
+                # Steer
+                if (random_turn_chance[sid] > np.float32(0.0)
+                        and np.float32(np.random.random()) < random_turn_chance[sid]):
+                    a += np.float32(np.random.uniform(-math.pi/4, math.pi/4))
+                elif front_val > left_val and front_val > right_val:
+                    pass
+                elif left_val > right_val:
+                    a -= rotation_angle[i] * turn_scale[sid]
+                else:
+                    a += rotation_angle[i] * turn_scale[sid]
+                
+                # Move, bouncing off obstacles, and wrap around the screen
+                new_x = x[i] + speed[i] * math.cos(a)
+                new_y = y[i] + speed[i] * math.sin(a)
+                if obstacle_map[int(new_x) % width, int(new_y) % height] > np.float32(0.5):
+                    a += np.float32(math.pi)
+                else:
+                    x[i] = new_x
+                    y[i] = new_y
+                angle[i] = a
+                x[i] %= fwidth
+                y[i] %= fheight
+                cx = int(x[i]) % width
+                cy = int(y[i]) % height
+                ix[step, i] = cx
+                iy[step, i] = cy
+                
+                # Feed, burn energy and maybe reproduce. Each meal takes the
+                # consumption_rate of SlimeMold._apply_particle_effects (0.5)
+                # off this particle's view of the cell it is standing on
+                if cx != food_cx or cy != food_cy:
+                    food_cx = cx
+                    food_cy = cy
+                    food_left = food_map[cx, cy]
+                ate[step, i] = food_left > np.float32(0.0)
+                if ate[step, i]:
+                    food_left -= np.float32(0.5)
+                    energy[i] = min(np.float32(100.0), energy[i] + np.float32(20.0))
+                energy[i] -= np.float32(0.005) if abs(speed[i]) > np.float32(0.1) else np.float32(0.0025)
+                if energy[i] > np.float32(80.0) and np.float32(np.random.random()) < reproduction_chance:
+                    births[i] += 1
+                    energy[i] -= np.float32(30.0)
+                if energy[i] <= np.float32(0.0):
+                    break
+
+# Simplex noise, vectorized over coordinate arrays. This is a port of
+# snoise2 from the `noise` package (same permutation and gradient tables),
+# so the generated environment matches the scalar version cell for cell.
+_SIMPLEX_PERM = np.array([
+    151, 160, 137, 91, 90, 15, 131, 13, 201, 95, 96, 53, 194, 233, 7, 225, 140,
+    36, 103, 30, 69, 142, 8, 99, 37, 240, 21, 10, 23, 190, 6, 148, 247, 120,
+    234, 75, 0, 26, 197, 62, 94, 252, 219, 203, 117, 35, 11, 32, 57, 177, 33,
+    88, 237, 149, 56, 87, 174, 20, 125, 136, 171, 168, 68, 175, 74, 165, 71,
+    134, 139, 48, 27, 166, 77, 146, 158, 231, 83, 111, 229, 122, 60, 211, 133,
+    230, 220, 105, 92, 41, 55, 46, 245, 40, 244, 102, 143, 54, 65, 25, 63, 161,
+    1, 216, 80, 73, 209, 76, 132, 187, 208, 89, 18, 169, 200, 196, 135, 130,
+    116, 188, 159, 86, 164, 100, 109, 198, 173, 186, 3, 64, 52, 217, 226, 250,
+    124, 123, 5, 202, 38, 147, 118, 126, 255, 82, 85, 212, 207, 206, 59, 227,
+    47, 16, 58, 17, 182, 189, 28, 42, 223, 183, 170, 213, 119, 248, 152, 2, 44,
+    154, 163, 70, 221, 153, 101, 155, 167, 43, 172, 9, 129, 22, 39, 253, 19,
+    98, 108, 110, 79, 113, 224, 232, 178, 185, 112, 104, 218, 246, 97, 228,
+    251, 34, 242, 193, 238, 210, 144, 12, 191, 179, 162, 241, 81, 51, 145, 235,
+    249, 14, 239, 107, 49, 192, 214, 31, 181, 199, 106, 157, 184, 84, 204, 176,
+    115, 121, 50, 45, 127, 4, 150, 254, 138, 236, 205, 93, 222, 114, 67, 29,
+    24, 72, 243, 141, 128, 195, 78, 66, 215, 61, 156, 180
+], dtype=np.int32)
+_SIMPLEX_PERM = np.concatenate((_SIMPLEX_PERM, _SIMPLEX_PERM))
+_SIMPLEX_GRAD = np.array([
+    (1, 1), (-1, 1), (1, -1), (-1, -1),
+    (1, 0), (-1, 0), (1, 0), (-1, 0),
+    (0, 1), (0, -1), (0, 1), (0, -1)
+], dtype=np.float32)
+# Gradient components looked up directly by hash value (hash % 12)
+_SIMPLEX_GRAD_X = _SIMPLEX_GRAD[np.arange(256) % 12, 0]
+_SIMPLEX_GRAD_Y = _SIMPLEX_GRAD[np.arange(256) % 12, 1]
+_SIMPLEX_F2 = np.float32(0.5 * (math.sqrt(3.0) - 1.0))
+_SIMPLEX_G2 = np.float32((3.0 - math.sqrt(3.0)) / 6.0)
+
+def simplex_noise2(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    x = np.asarray(x, dtype=np.float32)
+    y = np.asarray(y, dtype=np.float32)
+    # Skew into simplex space to find the containing cell
+    s = (x + y) * _SIMPLEX_F2
+    i = np.floor(x + s)
+    j = np.floor(y + s)
+    t = (i + j) * _SIMPLEX_G2
+    x0 = x - (i - t)
+    y0 = y - (j - t)
+    
+    # Pick the middle corner of the simplex triangle
+    i1 = x0 > y0
+    j1 = ~i1
+    corners = (
+        (x0, y0, 0, 0),
+        (x0 - i1 + _SIMPLEX_G2, y0 - j1 + _SIMPLEX_G2, i1, j1),
+        (x0 + _SIMPLEX_G2 * 2 - 1, y0 + _SIMPLEX_G2 * 2 - 1, 1, 1)
+    )
+    
+    ii = i.astype(np.int32) & 255
+    jj = j.astype(np.int32) & 255
+    total = np.zeros(np.broadcast(x, y).shape, dtype=np.float32)
+    for cx, cy, di, dj in corners:
+        h = _SIMPLEX_PERM[ii + di + _SIMPLEX_PERM[jj + dj]]
+        # Corners further than the falloff radius contribute nothing
+        f = np.maximum(0.5 - cx * cx - cy * cy, 0)
+        f *= f
+        f *= f
+        total += f * (_SIMPLEX_GRAD_X[h] * cx + _SIMPLEX_GRAD_Y[h] * cy)
+    return total * 70
+
+def fractal_noise2(x: np.ndarray, y: np.ndarray, octaves: int = 1,
+                   persistence: float = 0.5, lacunarity: float = 2.0) -> np.ndarray:
+    # Same octave summation as snoise2(x, y, octaves=...)
+    x = np.asarray(x, dtype=np.float32)
+    y = np.asarray(y, dtype=np.float32)
+    freq, amp, max_amp = 1.0, 1.0, 1.0
+    total = simplex_noise2(x, y)
+    for _ in range(1, octaves):
+        freq *= lacunarity
+        amp *= persistence
+        max_amp += amp
+        total += simplex_noise2(x * freq, y * freq) * amp
+    return total / max_amp
 
 class Environment:
     def __init__(self, width: int, height: int):
         self.width = width
         self.height = height
-        self.temperature_map = np.zeros((width, height))
-        self.moisture_map = np.zeros((width, height))
-        self.obstacle_map = np.zeros((width, height))
-        self.food_map = np.zeros((width, height))
-        self.pheromone_map = np.zeros((width, height))
-        self.pheromone_decay_rate = 0.99
-        self.temperature_change_rate = 0.1
-        self.moisture_change_rate = 0.05
+        # Maps are indexed map[x, y] and kept C-ordered, so y is the contiguous
+        # axis. This matches pygame's (width, height) surfarray shape and the
+        # flat cell index x * height + y used when scattering into the maps.
+        # Single precision is plenty here and halves the memory traffic
+        self.obstacle_map = np.zeros((width, height), dtype=np.float32)
+        self.food_map = np.zeros((width, height), dtype=np.float32)
+        self.pheromone_map = np.zeros((width, height), dtype=np.float32)
+        self.pheromone_decay_rate = np.float32(0.99)
+        # The day/night cycle shifts the whole map uniformly, so it is kept as
+        # scalar offsets added to the read-only base maps when they are sampled
+        self.time = 0.0  # Simulated seconds, one step per 1/60 s
+        # Swing amplitudes either side of the base maps. The old per-frame change
+        # rates were integrated without bound, so they give no amplitude to keep;
+        # these are sized against the species preferences instead. ±5 °C is half
+        # the ±10 °C noise spread and carries cells across the 20-25 °C preferred
+        # range, and ±0.1 moisture spans the 0.6-0.8 preferences peak to peak
+        self.temperature_swing = 5.0
+        self.moisture_swing = 0.1
+        self.temperature_offset = 0.0
+        self.moisture_offset = 0.0
+        # Flat indices of food cells emptied since the display last caught up.
+        # Nothing here drains it; whoever draws the food layer must clear it
+        # (SlimeMoldSimulator does so every frame)
+        self.depleted_food_cells = []
         self.generate_environment()
 
     def generate_environment(self):
-        # Generate temperature variations
+        # Generate temperature variations. Coordinates broadcast to (width, height)
+        # so each map is filled in one pass in its own memory order
         scale = 0.02
-        for x in range(self.width):
-            for y in range(self.height):
-                self.temperature_map[x, y] = snoise2(x * scale, y * scale, octaves=3) * 10 + 20  # 20°C ± 10°C
-                self.moisture_map[x, y] = snoise2(x * scale + 1000, y * scale + 1000, octaves=3) * 0.5 + 0.5
-                
-                # Generate obstacles
-                if snoise2(x * scale + 2000, y * scale + 2000, octaves=2) > 0.7:
-                    self.obstacle_map[x, y] = 1.0
-                
-                # Generate more food sources
-                if snoise2(x * scale + 3000, y * scale + 3000, octaves=4) > 0.5:  # Lowered threshold
-                    self.food_map[x, y] = 1.0
+        x = (np.arange(self.width) * scale)[:, None]
+        y = (np.arange(self.height) * scale)[None, :]
+        self.base_temperature_map = fractal_noise2(x, y, octaves=3) * 10 + 20  # 20°C ± 10°C
+        self.base_moisture_map = fractal_noise2(x + 1000, y + 1000, octaves=3) * 0.5 + 0.5
+        self.base_temperature_map.setflags(write=False)
+        self.base_moisture_map.setflags(write=False)
+        
+        # Generate obstacles
+        self.obstacle_map[:] = fractal_noise2(x + 2000, y + 2000, octaves=2) > 0.7
+        
+        # Generate more food sources
+        self.food_map[:] = fractal_noise2(x + 3000, y + 3000, octaves=4) > 0.5  # Lowered threshold
 
-    def update(self):
+    def update(self, num_steps: int = 1):
         # Decay pheromones
-        self.pheromone_map *= self.pheromone_decay_rate
+        self.pheromone_map *= self.pheromone_decay_rate ** num_steps
         # Update temperature and moisture (simulate day/night cycle)
-        time = pygame.time.get_ticks() / 1000
-        self.temperature_map += np.sin(time / 60) * self.temperature_change_rate
-        self.moisture_map += np.cos(time / 60) * self.moisture_change_rate
+        self.time += num_steps / 60
+        self.temperature_offset = math.sin(self.time / 60) * self.temperature_swing
+        self.moisture_offset = math.cos(self.time / 60) * self.moisture_swing
 
 class SlimeMold:
-    def __init__(self, width: int, height: int, simulator=None):
+    def __init__(self, width: int, height: int, simulator=None, seed=None):
         self.width = width
         self.height = height
-        self.particles: List[Particle] = []
+        # Batched random draws for the NumPy code paths; the JIT kernel uses
+        # Numba's own per-thread generator
+        self.rng = np.random.default_rng(seed)
+        self.particles = ParticleArrays()
         self.environment = Environment(width, height)
         self.simulator = simulator  # Store simulator reference
         
@@ -81,6 +346,9 @@ class SlimeMold:
                 'trail_strength': 1.0,
                 'moisture_pref': 0.7,
                 'temp_pref': 25.0,
+                'sensor_angle': math.pi / 4,
+                'turn_scale': 1.0,  # Strong trail following
+                'random_turn_chance': 0.0,
                 'count': 200
             },
             Species.DICTYOSTELIUM: {
@@ -89,6 +357,9 @@ class SlimeMold:
                 'trail_strength': 0.8,
                 'moisture_pref': 0.8,
                 'temp_pref': 22.0,
+                'sensor_angle': math.pi / 4,
+                'turn_scale': 1.0,
+                'random_turn_chance': 0.1,  # More exploratory
                 'count': 200
             },
             Species.FULIGO: {
@@ -97,180 +368,269 @@ class SlimeMold:
                 'trail_strength': 1.2,
                 'moisture_pref': 0.6,
                 'temp_pref': 20.0,
+                'sensor_angle': math.pi / 4,
+                'turn_scale': 0.5,  # Cautious turns
+                'random_turn_chance': 0.0,
                 'count': 200
             }
         }
         
+        # Parameter tables indexed by species_id for the vectorized update
+        self.base_speed = self.species_table('speed')
+        self.base_sensor_distance = self.species_table('sensor_distance')
+        self.trail_strength = self.species_table('trail_strength')
+        self.moisture_pref = self.species_table('moisture_pref')
+        self.temp_pref = self.species_table('temp_pref')
+        self.sensor_cos = np.cos(self.species_table('sensor_angle'))
+        self.sensor_sin = np.sin(self.species_table('sensor_angle'))
+        self.turn_scale = self.species_table('turn_scale')
+        self.random_turn_chance = self.species_table('random_turn_chance')
+        self.use_jit = NUMBA_AVAILABLE
+        # Thread sharding for the NumPy path, only worth it for big populations
+        self.num_workers = os.cpu_count() or 1
+        self.min_particles_per_worker = 10000
+        self._executor = None
+        self._worker_rngs = None
+        
         self.initialize_particles()
         
+    def species_table(self, key: str) -> np.ndarray:
+        return np.array([self.species_params[s][key] for s in Species], dtype=np.float32)
+
     def initialize_particles(self):
         for species in Species:
-            params = self.species_params[species]
-            for _ in range(params['count']):
-                # Start particles in a tighter group in the center
-                angle = random.uniform(0, 2 * math.pi)
-                radius = random.uniform(0, 50)  # Tighter initial group
-                x = self.width // 2 + radius * math.cos(angle)
-                y = self.height // 2 + radius * math.sin(angle)
-                
-                self.particles.append(Particle(
-                    x=x,
-                    y=y,
-                    angle=random.uniform(0, 2 * math.pi),
-                    speed=params['speed'],
-                    species=species,
-                    energy=100.0,
-                    moisture_preference=params['moisture_pref'],
-                    temperature_preference=params['temp_pref'],
-                    trail_strength=params['trail_strength'],
-                    sensor_distance=params['sensor_distance'],
-                    sensor_angle=math.pi / 4,
-                    rotation_angle=math.pi / 8
-                ))
-
-    def update(self):
-        for particle in self.particles:
-            # Get environmental conditions at particle position
-            x, y = int(particle.x), int(particle.y)
-            temperature = self.environment.temperature_map[x, y]
-            moisture = self.environment.moisture_map[x, y]
-            
-            # Adjust behavior based on environmental conditions
-            temp_diff = abs(temperature - particle.temperature_preference)
-            moisture_diff = abs(moisture - particle.moisture_preference)
-            
-            # Calculate environmental stress
-            stress = (temp_diff / 10) + moisture_diff
-            particle.speed = max(0.1, particle.speed * (1 - stress * 0.1))
-            
-            # Sensor positions - increase sensor distance when energy is low
-            sensor_dist = particle.sensor_distance * (1.0 + (100.0 - particle.energy) / 50.0)
-            front_x = particle.x + sensor_dist * math.cos(particle.angle)
-            front_y = particle.y + sensor_dist * math.sin(particle.angle)
-            
-            left_x = particle.x + sensor_dist * math.cos(particle.angle - particle.sensor_angle)
-            left_y = particle.y + sensor_dist * math.sin(particle.angle - particle.sensor_angle)
-            
-            right_x = particle.x + sensor_dist * math.cos(particle.angle + particle.sensor_angle)
-            right_y = particle.y + sensor_dist * math.sin(particle.angle + particle.sensor_angle)
-            
-            # Get sensor values
-            front_val = self.get_sensor_value(front_x, front_y, particle)
-            left_val = self.get_sensor_value(left_x, left_y, particle)
-            right_val = self.get_sensor_value(right_x, right_y, particle)
-            
-            # Decision making with species-specific behavior
-            if particle.species == Species.PHYSARUM:
-                # Physarum follows strong trails and food
-                if front_val > left_val and front_val > right_val:
-                    pass
-                elif left_val > right_val:
-                    particle.angle -= particle.rotation_angle
-                else:
-                    particle.angle += particle.rotation_angle
-            elif particle.species == Species.DICTYOSTELIUM:
-                # Dictyostelium is more exploratory
-                if random.random() < 0.1:  # Occasional random turns
-                    particle.angle += random.uniform(-math.pi/4, math.pi/4)
-                elif front_val > left_val and front_val > right_val:
-                    pass
-                elif left_val > right_val:
-                    particle.angle -= particle.rotation_angle
-                else:
-                    particle.angle += particle.rotation_angle
-            else:  # FULIGO
-                # Fuligo is cautious but follows food
-                if front_val > left_val and front_val > right_val:
-                    pass
-                elif left_val > right_val:
-                    particle.angle -= particle.rotation_angle * 0.5
-                else:
-                    particle.angle += particle.rotation_angle * 0.5
-            
-            # Move particle
-            new_x = particle.x + particle.speed * math.cos(particle.angle)
-            new_y = particle.y + particle.speed * math.sin(particle.angle)
-            
-            # Check for obstacles
-            if not self.is_obstacle(new_x, new_y):
-                particle.x = new_x
-                particle.y = new_y
+            self.spawn_species(species)
+
+    def spawn_species(self, species: Species):
+        params = self.species_params[species]
+        n = params['count']
+        # Start particles in a tighter group in the center
+        angle = self.rng.uniform(0, 2 * math.pi, n)
+        radius = self.rng.uniform(0, 50, n)  # Tighter initial group
+        self.particles.append(
+            n,
+            x=self.width // 2 + radius * np.cos(angle),
+            y=self.height // 2 + radius * np.sin(angle),
+            angle=self.rng.uniform(0, 2 * math.pi, n),
+            speed=self.base_speed[species.value],
+            species_id=species.value,
+            energy=100.0,
+            sensor_distance=self.base_sensor_distance[species.value],
+            rotation_angle=math.pi / 8
+        )
+
+    def update(self, num_steps: int = 1):
+        p = self.particles
+        
+        # Get time scale for speed adjustments
+        time_scale = 1.0
+        if self.simulator:
+            time_scale = self.simulator.speed_settings[self.simulator.current_speed]['simulation_speed']
+        # Reproduce if energy is high (adjusted for speed)
+        reproduction_chance = 0.001 * time_scale
+        
+        if self.use_jit:
+            # All steps run inside the kernel; map writes and births are folded in afterwards
+            if p.count:
+                self._update_particles_jit(num_steps, reproduction_chance)
             else:
-                # Bounce off obstacles
-                particle.angle += math.pi
-            
-            # Wrap around screen
-            particle.x %= self.width
-            particle.y %= self.height
-            
-            # Update trail map (stronger trails for better cohesion)
-            x, y = int(particle.x), int(particle.y)
-            if 0 <= x < self.width and 0 <= y < self.height:
-                self.environment.pheromone_map[x, y] = min(1.0, 
-                    self.environment.pheromone_map[x, y] + particle.trail_strength)
-            
-            # Get time scale for speed adjustments
-            time_scale = 1.0
-            if self.simulator:
-                time_scale = self.simulator.speed_settings[self.simulator.current_speed]['simulation_speed']
-            
-            # Consume food and update energy
-            if self.environment.food_map[x, y] > 0:
-                # Consume food more aggressively
-                consumption_rate = 0.5  # Much higher consumption rate
-                energy_gain = 20.0  # Much higher energy gain
-                particle.energy = min(100.0, particle.energy + energy_gain)
-                self.environment.food_map[x, y] = max(0, self.environment.food_map[x, y] - consumption_rate)
+                self.environment.update(num_steps)
+            p.keep(p.energy[:p.count] > 0)
+            return
+        
+        for _ in range(num_steps):
+            n = p.count
+            if n:
+                ix, iy, ate, breed = self._move_particles_parallel(n, reproduction_chance)
+                deposit = self.trail_strength[p.species_id[:n]]
+                self._apply_particle_effects(ix, iy, deposit, ate, breed)
             
-            # Decrease energy over time (slower when not moving)
-            movement_factor = 1.0 if abs(particle.speed) > 0.1 else 0.5
-            # Energy consumption is now independent of time_scale to prevent rapid death at high speeds
-            particle.energy -= 0.005 * movement_factor
+            # Update environment
+            self.environment.update()
             
-            # Reproduce if energy is high (adjusted for speed)
-            if particle.energy > 80 and random.random() < 0.001 * time_scale:
-                self.particles.append(Particle(
-                    x=particle.x,
-                    y=particle.y,
-                    angle=random.uniform(0, 2 * math.pi),
-                    speed=particle.speed,
-                    species=particle.species,
-                    energy=50.0,
-                    moisture_preference=particle.moisture_preference,
-                    temperature_preference=particle.temperature_preference,
-                    trail_strength=particle.trail_strength,
-                    sensor_distance=particle.sensor_distance,
-                    sensor_angle=particle.sensor_angle,
-                    rotation_angle=particle.rotation_angle
-                ))
-                particle.energy -= 30  # Reduced energy cost for reproduction
-
-        # Update environment
-        self.environment.update()
-        
-        # Remove dead particles
-        self.particles = [p for p in self.particles if p.energy > 0]
-
-    def get_sensor_value(self, x: float, y: float, particle: Particle) -> float:
-        x = int(x) % self.width
-        y = int(y) % self.height
-        if self.is_obstacle(x, y):
-            return -1.0
-        
-        # Food is the primary attractant
-        food_value = self.environment.food_map[x, y]
-        if food_value > 0:
-            # Make food extremely attractive, especially when hungry
-            hunger_factor = 1.0 + (100.0 - particle.energy) / 20.0
-            return food_value * 100.0 * hunger_factor
-        
-        # Pheromones are secondary
-        pheromone_value = self.environment.pheromone_map[x, y]
-        return pheromone_value * 0.5  # Moderate trail following
-
-    def is_obstacle(self, x: float, y: float) -> bool:
-        x = int(x) % self.width
-        y = int(y) % self.height
+            # Remove dead particles
+            p.keep(p.energy[:p.count] > 0)
+
+    def _update_particles_jit(self, num_steps: int, reproduction_chance: float):
+        env = self.environment
+        p = self.particles
+        n = p.count
+        ix = np.full((num_steps, n), -1, dtype=np.int32)
+        iy = np.empty((num_steps, n), dtype=np.int32)
+        ate = np.zeros((num_steps, n), dtype=np.bool_)
+        births = np.zeros(n, dtype=np.int32)
+        _update_particles(
+            p.x[:n], p.y[:n], p.angle[:n], p.speed[:n], p.energy[:n], p.species_id[:n],
+            p.sensor_distance[:n], p.rotation_angle[:n], self.moisture_pref,
+            self.temp_pref, self.sensor_cos, self.sensor_sin, self.turn_scale,
+            self.random_turn_chance,
+            env.base_temperature_map, env.base_moisture_map, np.float32(env.temperature_offset),
+            np.float32(env.moisture_offset), env.food_map, env.obstacle_map,
+            env.pheromone_map, self.width, self.height, np.float32(reproduction_chance),
+            ix, iy, ate, births)
+        
+        # Decay the maps for every step first, then add each step's trail
+        # deposit scaled by the decay it would have gone through since. The
+        # step by step path caps trails at 1.0 before the last decay, so the
+        # cap here is that decay too
+        env.update(num_steps)
+        decay = env.pheromone_decay_rate ** np.arange(num_steps, 0, -1, dtype=np.float32)
+        deposit = self.trail_strength[p.species_id[:n]] * decay[:, None]
+        visited = ix >= 0
+        self._apply_particle_effects(ix[visited], iy[visited], deposit[visited], ate[visited], births,
+                                     max_pheromone=env.pheromone_decay_rate)
+
+    def _move_particles_parallel(self, n: int, reproduction_chance: float):
+        # Without Numba, large populations are split into contiguous shards that
+        # run on worker threads; NumPy releases the GIL inside its array loops.
+        # The maps are only read here and every shard writes its own slice of
+        # the particle columns, so shared map writes can wait for the join
+        workers = min(self.num_workers, n // self.min_particles_per_worker)
+        if workers < 2:
+            return self._move_particles_numpy(0, n, reproduction_chance, self.rng)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self.num_workers)
+            self._worker_rngs = self.rng.spawn(self.num_workers)
+        bounds = np.linspace(0, n, workers + 1).astype(int)
+        futures = [
+            self._executor.submit(self._move_particles_numpy, start, stop, reproduction_chance, rng)
+            for start, stop, rng in zip(bounds[:-1], bounds[1:], self._worker_rngs)
+        ]
+        shards = [future.result() for future in futures]
+        return tuple(np.concatenate(parts) for parts in zip(*shards))
+
+    def _move_particles_numpy(self, start: int, stop: int, reproduction_chance: float,
+                              rng: np.random.Generator):
+        env = self.environment
+        p = self.particles
+        n = stop - start
+        x, y, angle = p.x[start:stop], p.y[start:stop], p.angle[start:stop]
+        speed, energy = p.speed[start:stop], p.energy[start:stop]
+        species_id = p.species_id[start:stop]
+        
+        # Get environmental conditions at particle positions
+        ix, iy = self.cell_indices(x, y)
+        temperature = env.base_temperature_map[ix, iy] + env.temperature_offset
+        moisture = env.base_moisture_map[ix, iy] + env.moisture_offset
+        
+        # Adjust behavior based on environmental conditions
+        temp_diff = np.abs(temperature - self.temp_pref[species_id])
+        moisture_diff = np.abs(moisture - self.moisture_pref[species_id])
+        
+        # Calculate environmental stress
+        stress = (temp_diff / 10) + moisture_diff
+        np.maximum(0.1, speed * (1 - stress * 0.1), out=speed)
+        
+        # Sensor positions (front, left, right) - increase sensor distance when energy is low
+        sensor_dist = p.sensor_distance[start:stop] * (1.0 + (100.0 - energy) / 50.0)
+        # Side sensors use the angle-addition identities on the heading's cos/sin
+        ca, sa = np.cos(angle), np.sin(angle)
+        cs, ss = self.sensor_cos[species_id], self.sensor_sin[species_id]
+        sensor_dx = np.stack((ca, ca * cs + sa * ss, ca * cs - sa * ss), axis=1)
+        sensor_dy = np.stack((sa, sa * cs - ca * ss, sa * cs + ca * ss), axis=1)
+        sensor_x = x[:, None] + sensor_dist[:, None] * sensor_dx
+        sensor_y = y[:, None] + sensor_dist[:, None] * sensor_dy
+        
+        # Get sensor values
+        values = self.get_sensor_value(sensor_x, sensor_y, energy[:, None])
+        front_val, left_val, right_val = values[:, 0], values[:, 1], values[:, 2]
+        
+        # Decision making with species-specific behavior: steer towards the
+        # stronger side unless the front sensor already wins
+        rotation = p.rotation_angle[start:stop] * self.turn_scale[species_id]
+        turn = np.where(left_val > right_val, -rotation, rotation)
+        turn[(front_val > left_val) & (front_val > right_val)] = 0.0
+        # Exploratory species take occasional random turns
+        explore = rng.random(n, dtype=np.float32) < self.random_turn_chance[species_id]
+        turn[explore] = rng.uniform(-math.pi/4, math.pi/4, np.count_nonzero(explore))
+        angle += turn
+        
+        # Move particles
+        new_x = x + speed * np.cos(angle)
+        new_y = y + speed * np.sin(angle)
+        
+        # Check for obstacles
+        blocked = self.is_obstacle(new_x, new_y)
+        free = ~blocked
+        x[free] = new_x[free]
+        y[free] = new_y[free]
+        # Bounce off obstacles
+        angle[blocked] += math.pi
+        
+        # Wrap around screen
+        x %= self.width
+        y %= self.height
+        ix, iy = self.cell_indices(x, y)
+        
+        # Feed on food under the particle
+        ate = env.food_map[ix, iy] > 0
+        energy[ate] = np.minimum(100.0, energy[ate] + 20.0)  # Much higher energy gain
+        
+        # Decrease energy over time (slower when not moving)
+        movement_factor = np.where(np.abs(speed) > 0.1, 1.0, 0.5)
+        # Energy consumption is now independent of time_scale to prevent rapid death at high speeds
+        energy -= 0.005 * movement_factor
+        
+        breed = (energy > 80) & (rng.random(n, dtype=np.float32) < reproduction_chance)
+        energy[breed] -= 30  # Reduced energy cost for reproduction
+        return ix, iy, ate, breed
+
+    def _apply_particle_effects(self, ix: np.ndarray, iy: np.ndarray, deposit: np.ndarray,
+                                ate: np.ndarray, births: np.ndarray, max_pheromone: float = 1.0):
+        # Shared map writes and births, kept out of the per-particle step so
+        # particles landing on the same cell are all accounted for. ix/iy,
+        # deposit and ate have one entry per step taken; births has one count
+        # per live particle. Trails are capped at max_pheromone
+        env = self.environment
+        p = self.particles
+        
+        # Update trail map (stronger trails for better cohesion)
+        cells, deposit = self._sum_per_cell(ix, iy, deposit)
+        pheromone = env.pheromone_map.reshape(-1)
+        pheromone[cells] = np.minimum(max_pheromone, pheromone[cells] + deposit)
+        
+        # Consume food more aggressively
+        if ate.any():
+            consumption_rate = 0.5  # Much higher consumption rate
+            cells, eaters = self._sum_per_cell(ix[ate], iy[ate])
+            food = env.food_map.reshape(-1)
+            food[cells] = np.maximum(0, food[cells] - consumption_rate * eaters)
+            emptied = cells[food[cells] <= 0]
+            if emptied.size:
+                env.depleted_food_cells.append(emptied)
+        
+        parents = np.repeat(np.arange(births.size), births)
+        if parents.size:
+            # Offspring copy their parent's row with a fresh heading and energy
+            children = {name: getattr(p, name)[parents] for name in ParticleArrays.FIELDS}
+            children['angle'] = self.rng.uniform(0, 2 * math.pi, parents.size)
+            children['energy'] = 50.0
+            p.append(parents.size, **children)
+
+    def _sum_per_cell(self, ix: np.ndarray, iy: np.ndarray, weights: np.ndarray = None):
+        # Duplicate-safe scatter: bincount over the distinct cells that were hit,
+        # which stays proportional to the particle count rather than the map size
+        cells, inverse = np.unique(ix * self.height + iy, return_inverse=True)
+        return cells, np.bincount(inverse, weights=weights)
+
+    def cell_indices(self, x: np.ndarray, y: np.ndarray):
+        return x.astype(np.int32) % self.width, y.astype(np.int32) % self.height
+
+    def get_sensor_value(self, x: np.ndarray, y: np.ndarray, energy: np.ndarray) -> np.ndarray:
+        env = self.environment
+        x, y = self.cell_indices(x, y)
+        
+        # Food is the primary attractant; make it extremely attractive, especially when hungry
+        food_value = env.food_map[x, y]
+        hunger_factor = 1.0 + (100.0 - energy) / 20.0
+        
+        # Pheromones are secondary (moderate trail following)
+        value = np.where(food_value > 0, food_value * 100.0 * hunger_factor, env.pheromone_map[x, y] * 0.5)
+        value[env.obstacle_map[x, y] > 0.5] = -1.0
+        return value
+
+    def is_obstacle(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        x, y = self.cell_indices(x, y)
         return self.environment.obstacle_map[x, y] > 0.5
 
 class SlimeMoldSimulator:
@@ -280,6 +640,8 @@ class SlimeMoldSimulator:
         pygame.display.set_caption("Enhanced Slime Mold Simulator")
         self.clock = pygame.time.Clock()
         self.slime_mold = SlimeMold(width, height, simulator=self)
+        self.font = pygame.font.Font(None, 36)
+        self._text_cache = {}
         self.running = True
         self.paused = False
         self.show_debug = False
@@ -288,6 +650,18 @@ class SlimeMoldSimulator:
         self.debug_surface = pygame.Surface((width, height))
         self.debug_surface.set_alpha(128)  # Semi-transparent
         
+        # Obstacles and food are pre-rendered into one layer; black is transparent
+        self.static_overlay = pygame.Surface((width, height))
+        self.static_overlay.set_colorkey((0, 0, 0))
+        self.render_static_overlay()
+        
+        # Particle colors indexed by species_id
+        self.species_colors = np.array([
+            (255, 255, 255),  # PHYSARUM
+            (255, 200, 200),  # DICTYOSTELIUM
+            (200, 200, 255)   # FULIGO
+        ], dtype=np.float32)
+        
         # Initialize active species
         self.active_species = {
             Species.PHYSARUM: True,
@@ -309,16 +683,16 @@ class SlimeMoldSimulator:
         speed_factor = self.speed_settings[self.current_speed]['simulation_speed']
         
         # Update particle speeds
-        for particle in self.slime_mold.particles:
-            base_speed = self.slime_mold.species_params[particle.species]['speed']
-            particle.speed = base_speed * speed_factor
-            # Also adjust sensor distance based on speed
-            particle.sensor_distance = self.slime_mold.species_params[particle.species]['sensor_distance'] * (1 + (speed_factor - 1) * 0.5)
+        slime_mold = self.slime_mold
+        n = slime_mold.particles.count
+        species_id = slime_mold.particles.species_id[:n]
+        slime_mold.particles.speed[:n] = slime_mold.base_speed[species_id] * speed_factor
+        # Also adjust sensor distance based on speed
+        slime_mold.particles.sensor_distance[:n] = slime_mold.base_sensor_distance[species_id] * (1 + (speed_factor - 1) * 0.5)
         
-        # Update environment parameters
-        self.slime_mold.environment.pheromone_decay_rate = 0.99 ** (1/speed_factor)
-        self.slime_mold.environment.temperature_change_rate = 0.1 * speed_factor
-        self.slime_mold.environment.moisture_change_rate = 0.05 * speed_factor
+        # Update environment parameters; the day/night cycle follows simulated
+        # time, so it already speeds up with the extra steps per frame
+        slime_mold.environment.pheromone_decay_rate = np.float32(0.99 ** (1/speed_factor))
 
     def run(self):
         last_time = pygame.time.get_ticks()
@@ -338,6 +712,7 @@ class SlimeMoldSimulator:
                     elif event.key == pygame.K_f:
                         x, y = pygame.mouse.get_pos()
                         self.slime_mold.environment.food_map[x, y] = 1.0
+                        self.static_overlay.set_at((x, y), (0, 255, 0))
                     elif event.key == pygame.K_1:
                         self.toggle_species(Species.PHYSARUM)
                     elif event.key == pygame.K_2:
@@ -357,8 +732,7 @@ class SlimeMoldSimulator:
                 # Update simulation multiple times per frame based on speed
                 speed_factor = self.speed_settings[self.current_speed]['simulation_speed']
                 num_updates = max(1, int(speed_factor))
-                for _ in range(num_updates):
-                    self.slime_mold.update()
+                self.slime_mold.update(num_updates)
 
             self.draw()
             pygame.display.flip()
@@ -369,113 +743,96 @@ class SlimeMoldSimulator:
     def toggle_species(self, species: Species):
         self.active_species[species] = not self.active_species[species]
         # Remove particles of inactive species
-        self.slime_mold.particles = [p for p in self.slime_mold.particles if self.active_species[p.species]]
+        particles = self.slime_mold.particles
+        active_ids = [s.value for s, active in self.active_species.items() if active]
+        particles.keep(np.isin(particles.species_id[:particles.count], active_ids))
         # Add particles for newly active species
         if self.active_species[species]:
-            params = self.slime_mold.species_params[species]
-            for _ in range(params['count']):
-                angle = random.uniform(0, 2 * math.pi)
-                radius = random.uniform(0, 50)
-                x = self.slime_mold.width // 2 + radius * math.cos(angle)
-                y = self.slime_mold.height // 2 + radius * math.sin(angle)
-                
-                self.slime_mold.particles.append(Particle(
-                    x=x,
-                    y=y,
-                    angle=random.uniform(0, 2 * math.pi),
-                    speed=params['speed'],
-                    species=species,
-                    energy=100.0,
-                    moisture_preference=params['moisture_pref'],
-                    temperature_preference=params['temp_pref'],
-                    trail_strength=params['trail_strength'],
-                    sensor_distance=params['sensor_distance'],
-                    sensor_angle=math.pi / 4,
-                    rotation_angle=math.pi / 8
-                ))
+            self.slime_mold.spawn_species(species)
 
     def reset_simulation(self):
         # Reset all particles
-        self.slime_mold.particles = []
+        self.slime_mold.particles.clear()
         # Reinitialize only active species
         for species in Species:
             if self.active_species[species]:
-                params = self.slime_mold.species_params[species]
-                for _ in range(params['count']):
-                    angle = random.uniform(0, 2 * math.pi)
-                    radius = random.uniform(0, 50)
-                    x = self.slime_mold.width // 2 + radius * math.cos(angle)
-                    y = self.slime_mold.height // 2 + radius * math.sin(angle)
-                    
-                    self.slime_mold.particles.append(Particle(
-                        x=x,
-                        y=y,
-                        angle=random.uniform(0, 2 * math.pi),
-                        speed=params['speed'],
-                        species=species,
-                        energy=100.0,
-                        moisture_preference=params['moisture_pref'],
-                        temperature_preference=params['temp_pref'],
-                        trail_strength=params['trail_strength'],
-                        sensor_distance=params['sensor_distance'],
-                        sensor_angle=math.pi / 4,
-                        rotation_angle=math.pi / 8
-                    ))
+                self.slime_mold.spawn_species(species)
+
+    def render_text(self, text: str, color) -> pygame.Surface:
+        # Labels rarely change between frames, so reuse their rendered surfaces
+        key = (text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            if len(self._text_cache) >= 256:  # Particle counts keep adding new labels
+                self._text_cache.clear()
+            surface = self._text_cache[key] = self.font.render(text, True, color)
+        return surface
+
+    def render_static_overlay(self):
+        # Draw obstacles and food sources (food on top)
+        env = self.slime_mold.environment
+        overlay = np.zeros((env.width, env.height, 3), dtype=np.uint8)
+        overlay[env.obstacle_map > 0.5] = (100, 100, 100)
+        overlay[env.food_map > 0] = (0, 255, 0)
+        pygame.surfarray.blit_array(self.static_overlay, overlay)
+        env.depleted_food_cells.clear()
+
+    def update_static_overlay(self):
+        # Food only disappears while the simulation runs, so just repaint the
+        # handful of cells that ran out since the last frame
+        env = self.slime_mold.environment
+        if not env.depleted_food_cells:
+            return
+        cells = np.concatenate(env.depleted_food_cells)
+        env.depleted_food_cells.clear()
+        for x, y in zip(*np.divmod(cells, env.height)):
+            color = (100, 100, 100) if env.obstacle_map[x, y] > 0.5 else (0, 0, 0)
+            self.static_overlay.set_at((int(x), int(y)), color)
+
+    def render_debug_overlay(self, step: int = 4):
+        # Sample the maps at reduced resolution and scale the result back up
+        env = self.slime_mold.environment
+        temp = env.base_temperature_map[::step, ::step] + env.temperature_offset
+        moisture = env.base_moisture_map[::step, ::step] + env.moisture_offset
+        
+        # Temperature map as a red/blue gradient
+        r = np.clip((temp * 10).astype(np.int32), 0, 255)
+        overlay = np.zeros(temp.shape + (3,), dtype=np.float32)
+        overlay[..., 0] = r
+        overlay[..., 2] = 255 - r
+        
+        # Moisture map as a blue overlay, stronger where it is wetter
+        alpha = np.clip((moisture * 50).astype(np.int32), 0, 255)[..., None] / 255.0
+        overlay = overlay * (1 - alpha) + np.array([0, 0, 255], dtype=np.float32) * alpha
+        
+        overlay = np.repeat(np.repeat(overlay.astype(np.uint8), step, axis=0), step, axis=1)
+        pygame.surfarray.blit_array(self.debug_surface, overlay[:env.width, :env.height])
 
     def draw(self):
         self.screen.fill((0, 0, 0))
         
         if self.show_debug:
-            # Clear debug surface
-            self.debug_surface.fill((0, 0, 0, 0))
-            
-            # Draw temperature map with reduced resolution
-            for x in range(0, self.slime_mold.width, 4):
-                for y in range(0, self.slime_mold.height, 4):
-                    temp = self.slime_mold.environment.temperature_map[x, y]
-                    # Ensure color values are integers and within valid range
-                    r = min(255, max(0, int(temp * 10)))
-                    b = min(255, max(0, 255 - int(temp * 10)))
-                    pygame.draw.rect(self.debug_surface, (r, 0, b), (x, y, 4, 4))
-            
-            # Draw moisture map with reduced resolution
-            for x in range(0, self.slime_mold.width, 4):
-                for y in range(0, self.slime_mold.height, 4):
-                    moisture = self.slime_mold.environment.moisture_map[x, y]
-                    alpha = min(255, max(0, int(moisture * 50)))
-                    pygame.draw.rect(self.debug_surface, (0, 0, 255, alpha), (x, y, 4, 4))
-            
+            self.render_debug_overlay()
             self.screen.blit(self.debug_surface, (0, 0))
         
-        # Draw obstacles with reduced resolution
-        for x in range(0, self.slime_mold.width, 2):
-            for y in range(0, self.slime_mold.height, 2):
-                if self.slime_mold.environment.obstacle_map[x, y] > 0.5:
-                    pygame.draw.rect(self.screen, (100, 100, 100), (x, y, 2, 2))
-        
-        # Draw food sources with reduced resolution
-        for x in range(0, self.slime_mold.width, 2):
-            for y in range(0, self.slime_mold.height, 2):
-                if self.slime_mold.environment.food_map[x, y] > 0:
-                    pygame.draw.rect(self.screen, (0, 255, 0), (x, y, 2, 2))
-        
-        # Draw particles
-        species_colors = {
-            Species.PHYSARUM: (255, 255, 255),
-            Species.DICTYOSTELIUM: (255, 200, 200),
-            Species.FULIGO: (200, 200, 255)
-        }
+        # Draw obstacles and food sources
+        self.update_static_overlay()
+        self.screen.blit(self.static_overlay, (0, 0))
         
-        for particle in self.slime_mold.particles:
-            if self.active_species[particle.species]:
-                color = species_colors[particle.species]
-                energy_factor = particle.energy / 100.0
-                color = tuple(int(c * energy_factor) for c in color)
-                pygame.draw.circle(self.screen, color, (int(particle.x), int(particle.y)), 1)
+        # Draw particles as single pixels, dimmed by their remaining energy
+        particles = self.slime_mold.particles
+        n = particles.count
+        active = np.array([self.active_species[species] for species in Species])
+        visible = active[particles.species_id[:n]]
+        x, y = self.slime_mold.cell_indices(particles.x[:n][visible], particles.y[:n][visible])
+        energy_factor = particles.energy[:n][visible] / 100.0
+        colors = self.species_colors[particles.species_id[:n][visible]] * energy_factor[:, None]
+        pixels = pygame.surfarray.pixels3d(self.screen)
+        pixels[x, y] = np.clip(colors, 0, 255).astype(np.uint8)
+        del pixels  # Unlock the screen surface
         
         # Draw UI
-        font = pygame.font.Font(None, 36)
-        text = font.render(f"Particles: {len(self.slime_mold.particles)}", True, (255, 255, 255))
+        text = self.render_text(f"Particles: {len(self.slime_mold.particles)}", (255, 255, 255))
         self.screen.blit(text, (10, 10))
         
         # Draw species status
@@ -483,21 +840,21 @@ class SlimeMoldSimulator:
         for species in Species:
             status = "ON" if self.active_species[species] else "OFF"
             color = (0, 255, 0) if self.active_species[species] else (255, 0, 0)
-            text = font.render(f"{species.name}: {status}", True, color)
+            text = self.render_text(f"{species.name}: {status}", color)
             self.screen.blit(text, (10, y_offset))
             y_offset += 30
         
         # Draw speed status
         speed_color = (255, 255, 0)  # Yellow
-        text = font.render(f"Speed: {self.speed_settings[self.current_speed]['name']}", True, speed_color)
+        text = self.render_text(f"Speed: {self.speed_settings[self.current_speed]['name']}", speed_color)
         self.screen.blit(text, (10, y_offset))
         
         if self.paused:
-            text = font.render("PAUSED", True, (255, 0, 0))
+            text = self.render_text("PAUSED", (255, 0, 0))
             self.screen.blit(text, (self.slime_mold.width - 100, 10))
         
         if self.show_debug:
-            text = font.render("DEBUG MODE", True, (0, 255, 0))
+            text = self.render_text("DEBUG MODE", (0, 255, 0))
             self.screen.blit(text, (10, self.slime_mold.height - 40))
 
 if __name__ == "__main__":